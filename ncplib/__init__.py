@@ -14,6 +14,7 @@ Features
 -   :doc:`client`.
 -   :doc:`server`.
 -   Asynchronous connections via :mod:`asyncio`.
+-   Optional `uvloop`_ support.
 
 
 Resources
@@ -53,7 +54,12 @@ More information
 
 
 from ncplib.client import connect as connect  # noqa
-from ncplib.connection import Connection as Connection, Response as Response, Field as Field  # noqa
+from ncplib.connection import (  # noqa
+    Connection as Connection,
+    Response as Response,
+    Field as Field,
+    install_uvloop as install_uvloop,
+)
 from ncplib.errors import (  # noqa
     NCPError as NCPError,
     NetworkError as NetworkError,
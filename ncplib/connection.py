@@ -25,20 +25,49 @@ Spawn a concurrent task to handle long-running commands:
 
     import asyncio
 
-    loop = asyncio.get_event_loop()
-
     async def handle_dspc_time(field):
         field.send(ACKN=1)
         await asyncio.sleep(10)  # Simulate a blocking task.
         field.send(TSDC=0, TIMM=1)
 
-    for field in connection:
+    async for field in connection:
         if field.packet_type == "DSPC" and field.name == "TIME":
             # Spawn a concurrent task to avoid blocking the accept loop.
-            loop.create_task(handle_dspc_time(field))
+            asyncio.create_task(handle_dspc_time(field))
         # Handle other field types here.
 
 
+Using uvloop
+^^^^^^^^^^^^
+
+:mod:`ncplib` works with any :mod:`asyncio` event loop. Installing `uvloop`_ will significantly speed up network
+throughput on high-traffic connections:
+
+.. code:: bash
+
+    pip install ncplib[uvloop]
+
+Call :func:`install_uvloop` before creating the event loop:
+
+.. code:: python
+
+    import asyncio
+    import ncplib
+
+    ncplib.install_uvloop()
+    asyncio.run(main())
+
+On Python 3.11 and above, uvloop can also be used without changing the global event loop policy:
+
+.. code:: python
+
+    import asyncio
+    import uvloop
+
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+        runner.run(main())
+
+
 API reference
 -------------
 
@@ -55,30 +84,40 @@ API reference
 
 .. autoclass:: Field
     :members:
+
+.. autofunction:: install_uvloop
+
+
+.. include:: /_include/links.rst
 """
 from __future__ import annotations
 import asyncio
 from async_timeout import timeout
-from datetime import datetime, timezone
+from collections import deque
+from datetime import datetime
+from functools import lru_cache
 from itertools import cycle
 import logging
-from time import time
+from time import time, time_ns
 from types import TracebackType
-from typing import AsyncIterator, Awaitable, Callable, Dict, List, Mapping, Optional, Set, Tuple, Type, TypeVar, Iterable
+from typing import (
+    AsyncIterator, Awaitable, Callable, Deque, Dict, Mapping, Optional, Set, Tuple, Type, TypeVar, Iterable,
+)
 from uuid import getnode as get_mac
 import warnings
 from ncplib.errors import NetworkError, NetworkTimeoutError, ConnectionClosed, DecodeError, DecodeWarning
-from ncplib.packets import Packet, Param, Params, Fields, encode_packet, decode_packet_cps, PACKET_HEADER_SIZE
+from ncplib.packets import Packet, Param, Params, Fields, encode_packet_ns, decode_packet_cps, PACKET_HEADER_SIZE
 
 
 T = TypeVar("T")
 
 
-# The last four bytes of the MAC address is used as an ID field.
-CLIENT_ID = get_mac().to_bytes(6, "little")[-4:]
+# The last four bytes of the MAC address is used as an ID field. This is looked up on first connect, since finding the
+# MAC address can be slow.
+@lru_cache(maxsize=None)
+def _get_client_id() -> bytes:
+    return get_mac().to_bytes(6, "little")[-4:]
 
-# The footer and other metadata for the LINK heartbeat packet trailer.
-LINK_TRAILER = b"".join((b'\x00\x00\x00\x00', CLIENT_ID, b'\x00\x00\x00\x00\xaa\xbb\xcc\xdd'))
 
 # ID generation.
 _gen_id = cycle(range(2 ** 32)).__next__
@@ -87,6 +126,21 @@ _gen_id = cycle(range(2 ** 32)).__next__
 DEFAULT_TIMEOUT: int = 60
 
 
+def install_uvloop() -> None:
+    """
+    Sets the :mod:`asyncio` event loop policy to use `uvloop`_, a fast drop-in replacement for the default event loop.
+
+    Must be called before the event loop is created.
+
+    :raises ImportError: if `uvloop`_ is not installed.
+    """
+    try:
+        import uvloop
+    except ImportError as ex:  # pragma: no cover
+        raise ImportError("uvloop is not installed, use `pip install ncplib[uvloop]`") from ex
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
 async def _wait_for(coro: Awaitable[T], ms: int) -> T:
     try:
         async with timeout(ms):
@@ -245,6 +299,9 @@ class Response(AsyncIteratorMixin):
         self._packet_type = packet_type
         self._expected_fields = expected_fields
 
+    def _is_reply(self, field: Field) -> bool:
+        return field.packet_type == self._packet_type and (field.name, field.id) in self._expected_fields
+
     async def recv(self) -> Field:
         """
         Waits for the next :class:`Field` received in reply to the sent :term:`NCP packet`.
@@ -255,10 +312,7 @@ class Response(AsyncIteratorMixin):
         """
         while True:
             field = await self._connection.recv()
-            if (
-                field.packet_type == self._packet_type and
-                (field.name, field.id) in self._expected_fields
-            ):
+            if self._is_reply(field):
                 return field
 
     async def recv_field(self, field_name: str) -> Field:
@@ -275,8 +329,8 @@ class Response(AsyncIteratorMixin):
         :rtype: Field
         """
         while True:
-            field = await self.recv()
-            if field.name == field_name:
+            field = await self._connection.recv()
+            if field.name == field_name and self._is_reply(field):
                 return field
 
 
@@ -319,7 +373,9 @@ class Connection(AsyncIteratorMixin):
     logger: logging.Logger
     _reader: asyncio.StreamReader
     _predicate: Callable[[Field], bool]
-    _field_buffer: List[Field]
+    _field_buffer: Deque[Field]
+    _client_id: bytes
+    _link_trailer: bytes
     _timeout: int
     _writer: asyncio.StreamWriter
     _remote_timeout: int
@@ -340,10 +396,13 @@ class Connection(AsyncIteratorMixin):
         # Packet reading.
         self._reader = reader
         self._predicate = predicate  # type: ignore
-        self._field_buffer = []
+        self._field_buffer = deque()
         self._timeout = timeout
         # Packet writing.
         self._writer = writer
+        self._client_id = _get_client_id()
+        # The footer and other metadata for the LINK heartbeat packet trailer.
+        self._link_trailer = b"".join((b'\x00\x00\x00\x00', self._client_id, b'\x00\x00\x00\x00\xaa\xbb\xcc\xdd'))
         self._remote_timeout = 0
         self._link_send_interval = 3
         self._link_send_handle = None
@@ -363,7 +422,7 @@ class Connection(AsyncIteratorMixin):
         self._writer.write(b"".join((
             b'\xdd\xcc\xbb\xaaLINK\n\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00',
             int(time()).to_bytes(4, "little"),
-            LINK_TRAILER,
+            self._link_trailer,
         )))
         self.logger.debug("Sent keep-alive to %s over NCP", self.remote_hostname)
         self._send_link_soon()
@@ -386,19 +445,28 @@ class Connection(AsyncIteratorMixin):
     # Receiving fields.
 
     async def _recv_packet(self) -> Packet:
-        # Read the header. If there's no more data in the pipe, it's a graceful close.
+        # The network timeout is applied here rather than via `_wait_for`, saving a coroutine per received packet.
         try:
-            header_buf = await self._reader.readexactly(PACKET_HEADER_SIZE)
-        except asyncio.IncompleteReadError as ex:
-            if len(ex.partial) == 0:
-                raise ConnectionClosed("Connection closed") from ex
-            raise DecodeError(ex) from ex  # pragma: no cover
-        # Read the body. This has to be present, or it's an unexpected close.
-        size_remaining, decode_packet_body = decode_packet_cps(header_buf)
-        try:
-            body_buf = await self._reader.readexactly(size_remaining)
-        except asyncio.IncompleteReadError as ex:  # pragma: no cover
-            raise DecodeError(ex) from ex
+            async with timeout(self._timeout):
+                # Read the header. If there's no more data in the pipe, it's a graceful close.
+                try:
+                    header_buf = await self._reader.readexactly(PACKET_HEADER_SIZE)
+                except asyncio.IncompleteReadError as ex:
+                    if len(ex.partial) == 0:
+                        raise ConnectionClosed("Connection closed") from ex
+                    raise DecodeError(ex) from ex  # pragma: no cover
+                # Read the body. This has to be present, or it's an unexpected close.
+                size_remaining, decode_packet_body = decode_packet_cps(header_buf)
+                try:
+                    body_buf = await self._reader.readexactly(size_remaining)
+                except asyncio.IncompleteReadError as ex:  # pragma: no cover
+                    raise DecodeError(ex) from ex
+        except asyncio.CancelledError:  # pragma: no cover
+            raise  # Propagate cancels, not needed in Python3.8+.
+        except asyncio.TimeoutError as ex:  # pragma: no cover
+            raise NetworkTimeoutError(ex) from ex
+        except OSError as ex:  # pragma: no cover
+            raise NetworkError(ex) from ex
         return decode_packet_body(body_buf)
 
     async def recv(self) -> Field:
@@ -412,24 +480,20 @@ class Connection(AsyncIteratorMixin):
         while True:
             # Return buffered fields.
             if self._field_buffer:
-                field = self._field_buffer.pop()
+                field = self._field_buffer.popleft()
                 self.logger.debug(
                     "Received field %s %s from %s over NCP",
                     field.packet_type, field.name, self.remote_hostname
                 )
                 if self._predicate(field):  # type: ignore
                     return field
-            packet_type, packet_id, packet_timestamp, packet_info, fields = await _wait_for(
-                self._recv_packet(),
-                self._timeout,
-            )
+            packet_type, packet_id, packet_timestamp, packet_info, fields = await self._recv_packet()
             # Store the fields in the field buffer.
             self.logger.debug("Received packet %s from %s over NCP", packet_type, self.remote_hostname)
-            self._field_buffer = [
+            self._field_buffer.extend(
                 Field(self, packet_type, packet_id, packet_timestamp, field_name, field_id, params)
                 for field_name, field_id, params in fields
-            ]
-            self._field_buffer.reverse()
+            )
 
     async def recv_field(self, packet_type: str, field_name: str) -> Field:
         """
@@ -469,13 +533,14 @@ class Connection(AsyncIteratorMixin):
     # Packet writing.
 
     def _send_packet(self, packet_type: str, fields: Fields) -> Response:
-        encoded_packet = encode_packet(packet_type, 1, datetime.now(tz=timezone.utc), CLIENT_ID, fields)
+        encoded_packet = encode_packet_ns(packet_type, 1, time_ns(), self._client_id, fields)
         self._writer.write(encoded_packet)
-        self.logger.debug("Sent packet %s to %s over NCP", packet_type, self.remote_hostname)
-        expected_fields = set()
-        for field_name, field_id, params in fields:
-            self.logger.debug("Sent field %s %s to %s over NCP", packet_type, field_name, self.remote_hostname)
-            expected_fields.add((field_name, field_id))
+        expected_fields = {(field_name, field_id) for field_name, field_id, _ in fields}
+        # Skip the per-field logging calls entirely when debug logging is disabled.
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Sent packet %s to %s over NCP", packet_type, self.remote_hostname)
+            for field_name, _, _ in fields:
+                self.logger.debug("Sent field %s %s to %s over NCP", packet_type, field_name, self.remote_hostname)
         # If the connection supports CCRE LINK, we can defer the LINK send.
         if self._remote_timeout > 0 and self._link_send_handle is not None:
             self._link_send_handle.cancel()
@@ -512,7 +577,7 @@ class Connection(AsyncIteratorMixin):
             in fields.items()
         ])
     
-    def send_packets(self, packet_type:str, fields: Iterable[Tuple[str, Param]]) -> Response:
+    def send_packets(self, packet_type: str, fields: Iterable[Tuple[str, Mapping[str, Param]]]) -> Response:
         """
         Sends a :term:`NCP packet <NCP packet>` with multiple fields.
 
@@ -524,7 +589,11 @@ class Connection(AsyncIteratorMixin):
         :rtype: Response
         """
 
-        return self._send_packet(packet_type, [(field[0], _gen_id(), field[1].items()) for field in fields])
+        return self._send_packet(packet_type, [
+            (field_name, _gen_id(), field_params.items())
+            for field_name, field_params
+            in fields
+        ])
 
     def send(self, packet_type: str, field_name: str, **params: Param) -> Response:
         """
@@ -52,11 +52,18 @@ class CommandMixin:
     code: int
 
     def __init__(self, field: Field, detail: str, code: int) -> None:
-        super().__init__(f"{field.packet_type} {field.name} {detail!r} (code {code})")  # type: ignore
+        # The message is formatted on demand by __str__, so raising doesn't pay for it.
+        super().__init__()
         self.field = field
         self.detail = detail
         self.code = code
 
+    def __str__(self) -> str:
+        return f"{self.field.packet_type} {self.field.name} {self.detail!r} (code {self.code})"
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({str(self)!r})"
+
 
 # Errors.
 
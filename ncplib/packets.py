@@ -12,9 +12,9 @@ from ncplib.values import u32, i64, u64, f64
 
 PACKET_HEADER_STRUCT = Struct("<4s4sII4sII4s")
 
-FIELD_HEADER_STRUCT = Struct("<4s3s1sI")
+FIELD_HEADER_STRUCT = Struct("<4sII")
 
-PARAM_HEADER_STRUCT = Struct("<4s3sB")
+PARAM_HEADER_STRUCT = Struct("<4sI")
 
 VALUE_F32_STRUCT = Struct("<f")
 
@@ -31,6 +31,8 @@ PARAM_HEADER_SIZE = PARAM_HEADER_STRUCT.size
 
 PACKET_FOOTER_SIZE = 8
 
+MAX_FIELD_SIZE = 0xFFFFFF * 4  # Field and param sizes are encoded as a 24-bit count of 4-byte words.
+
 
 # Byte Iterables.
 
@@ -107,32 +109,23 @@ Packet = Tuple[str, int, datetime, bytes, Fields]
 
 def encode_packet(packet_type: str, packet_id: int, timestamp: datetime, info: bytes, fields: Fields) -> bytes:
     timestamp = timestamp.astimezone(timezone.utc)
-    # Encode the header.
-    packet_header = bytearray(PACKET_HEADER_SIZE)
-    PACKET_HEADER_STRUCT.pack_into(
-        packet_header, 0,
-        PACKET_HEADER,  # Hardcoded packet header.
-        packet_type.encode(),
-        0,  # Placeholder for the packet size, which we will calculate soon.
-        packet_id,
-        PACKET_VERSION,
-        int(timestamp.timestamp()), timestamp.microsecond * 1000,
-        info,
+    return encode_packet_ns(
+        packet_type, packet_id,
+        int(timestamp.timestamp()) * 1_000_000_000 + timestamp.microsecond * 1000,
+        info, fields,
     )
+
+
+def encode_packet_ns(packet_type: str, packet_id: int, timestamp_ns: int, info: bytes, fields: Fields) -> bytes:
+    # The packet header is written last, once the packet size is known.
+    packet_header = bytearray(PACKET_HEADER_SIZE)
     chunks: List[Bytes] = [packet_header]
     offset = PACKET_HEADER_SIZE
     # Write the packet fields.
     for field_name, field_id, params in fields:
         field_offset = offset
-        # Write the field header.
+        # The field header is written once the field size is known.
         field_header = bytearray(FIELD_HEADER_SIZE)
-        FIELD_HEADER_STRUCT.pack_into(
-            field_header, 0,
-            field_name.encode(),
-            b"\x00\x00\x00",  # Placeholder for the field size, which we will calculate soom.
-            b"\x00",  # Field type ID is ignored.
-            field_id,
-        )
         chunks.append(field_header)
         offset += FIELD_HEADER_SIZE
         # Write the params.
@@ -169,27 +162,52 @@ def encode_packet(packet_type: str, packet_id: int, timestamp: datetime, info: b
             # Write the param header.
             param_size = PARAM_HEADER_SIZE + len(param_value)  # type: ignore
             param_padding_size = -param_size % 4
+            if param_size + param_padding_size > MAX_FIELD_SIZE:
+                raise OverflowError(f"Param {field_name} {param_name} too large ({param_size} bytes)")
             chunks.append(PARAM_HEADER_STRUCT.pack(
                 param_name.encode(),
-                ((param_size + param_padding_size) // 4).to_bytes(3, "little"),
-                param_type_id,
+                (param_size + param_padding_size) // 4 | param_type_id << 24,  # 24-bit size, 8-bit type ID.
             ))
             # Write the param value.
             chunks.append(param_value)  # type: ignore
             chunks.append(b"\x00" * param_padding_size)
             offset += param_size + param_padding_size
-        # Write the field size.
-        field_header[4:7] = ((offset - field_offset) // 4).to_bytes(3, "little")[:3]
+        # Write the field header.
+        field_size = offset - field_offset
+        if field_size > MAX_FIELD_SIZE:
+            raise OverflowError(f"Field {field_name} too large ({field_size} bytes)")
+        FIELD_HEADER_STRUCT.pack_into(
+            field_header, 0,
+            field_name.encode(),
+            field_size // 4,  # 24-bit size, field type ID is ignored.
+            field_id,
+        )
     # Encode the packet footer.
     chunks.append(PACKET_FOOTER_NO_CHECKSUM)
-    # Write the packet size.
-    packet_header[8:12] = ((offset + PACKET_FOOTER_SIZE) // 4).to_bytes(4, "little")
+    # Write the packet header.
+    PACKET_HEADER_STRUCT.pack_into(
+        packet_header, 0,
+        PACKET_HEADER,  # Hardcoded packet header.
+        packet_type.encode(),
+        (offset + PACKET_FOOTER_SIZE) // 4,
+        packet_id,
+        PACKET_VERSION,
+        *divmod(timestamp_ns, 1_000_000_000),
+        info,
+    )
     # All done!
     return b"".join(chunks)
 
 
 # PacketData decoding.
 
+TYPE_ID_TO_ARRAY_TYPE_CODES = {
+    type_id: type_code
+    for type_code, type_id
+    in ARRAY_TYPE_CODES_TO_TYPE_ID.items()
+}
+
+
 def decode_packet_cps(header_buf: Bytes) -> Tuple[int, Callable[[Bytes], Packet]]:
     (
         packet_header,
@@ -212,20 +230,25 @@ def decode_packet_cps(header_buf: Bytes) -> Tuple[int, Callable[[Bytes], Packet]
         # Check footer.
         if buf[-4:] != PACKET_FOOTER:  # pragma: no cover
             raise DecodeError(f"Invalid packet footer {buf[-4:]!r}")
+        # Bind struct methods used in the decode loop to locals.
+        unpack_field_header = FIELD_HEADER_STRUCT.unpack_from
+        unpack_param_header = PARAM_HEADER_STRUCT.unpack_from
         # Decode fields.
         field_limit = size_remaining - PACKET_FOOTER_SIZE
         fields = []
+        embedded_footer_count = 0
         while offset < field_limit:
             # Decode field header.
-            field_name, field_size, field_type_id, field_id = FIELD_HEADER_STRUCT.unpack_from(buf, offset)
-            param_limit = offset + int.from_bytes(field_size, "little") * 4
+            field_name, field_size, field_id = unpack_field_header(buf, offset)
+            param_limit = offset + (field_size & 0xFFFFFF) * 4  # 24-bit size, field type ID is ignored.
             offset += FIELD_HEADER_SIZE
             # Decode params.
             params = []
             while offset < param_limit:
                 # Decode the param header.
-                param_name, param_size, param_type_id = PARAM_HEADER_STRUCT.unpack_from(buf, offset)
-                param_size = int.from_bytes(param_size, "little") * 4
+                param_name, param_size = unpack_param_header(buf, offset)
+                param_type_id = param_size >> 24
+                param_size = (param_size & 0xFFFFFF) * 4
                 # Decode the param value.
                 param_value_raw = buf[offset+PARAM_HEADER_SIZE:offset+param_size]
                 param_value: Param
@@ -248,28 +271,19 @@ def decode_packet_cps(header_buf: Bytes) -> Tuple[int, Callable[[Bytes], Packet]
                     param_value = f64(VALUE_F64_STRUCT.unpack(param_value_raw)[0])
                 elif param_type_id == TYPE_RAW:
                     param_value = bytes(param_value_raw)
-                elif param_type_id == TYPE_ARRAY_U8:
-                    param_value = array("B", param_value_raw)
-                elif param_type_id == TYPE_ARRAY_U16:
-                    param_value = array("H", param_value_raw)
-                elif param_type_id == TYPE_ARRAY_U32:
-                    param_value = array("I", param_value_raw)
-                elif param_type_id == TYPE_ARRAY_I8:
-                    param_value = array("b", param_value_raw)
-                elif param_type_id == TYPE_ARRAY_I16:
-                    param_value = array("h", param_value_raw)
-                elif param_type_id == TYPE_ARRAY_I32:
-                    param_value = array("i", param_value_raw)
-                elif param_type_id == TYPE_ARRAY_U64:
-                    param_value = array("Q", param_value_raw)
-                elif param_type_id == TYPE_ARRAY_I64:
-                    param_value = array("q", param_value_raw)
-                elif param_type_id == TYPE_ARRAY_F32:
-                    param_value = array("f", param_value_raw)
-                elif param_type_id == TYPE_ARRAY_F64:
-                    param_value = array("d", param_value_raw)
-                else:  # pragma: no cover
-                    warnings.warn(DecodeWarning("Unsupported type ID", param_type_id))
+                else:
+                    param_type_code = TYPE_ID_TO_ARRAY_TYPE_CODES.get(param_type_id)
+                    if param_type_code is not None:
+                        param_value = array(param_type_code, param_value_raw)
+                    elif buf[offset:offset+PACKET_FOOTER_SIZE] == PACKET_FOOTER_NO_CHECKSUM:
+                        # Hack to fix a known bug with Axis nodes, which embed a packet footer at the end of a field.
+                        # The footer reads as a param with an unsupported type ID, so the check is off the hot path.
+                        embedded_footer_count += 1
+                        offset += PACKET_FOOTER_SIZE
+                        continue
+                    else:  # pragma: no cover
+                        warnings.warn(DecodeWarning("Unsupported type ID", param_type_id))
+                        param_value = bytes(param_value_raw)
                 # Store the param.
                 params.append((param_name.rstrip(b" \x00").decode("latin1"), param_value))
                 offset += param_size
@@ -281,6 +295,9 @@ def decode_packet_cps(header_buf: Bytes) -> Tuple[int, Callable[[Bytes], Packet]
         # Check for field overflow.
         if offset > field_limit:  # pragma: no cover
             raise DecodeError(f"Field overflow by {offset - field_limit} bytes")
+        # Warn once per packet about embedded footers, since issuing a warning is expensive.
+        if embedded_footer_count:
+            warnings.warn(DecodeWarning(f"Encountered {embedded_footer_count} embedded packet footer(s)"))
         # All done!
         return (
             packet_type.rstrip(b" \x00").decode("latin1"),
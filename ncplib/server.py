@@ -94,17 +94,15 @@ A simple ``client_connected`` callback might like this:
 Start the server
 ^^^^^^^^^^^^^^^^
 
-Start a new NCP server.
+Start a new NCP server using :func:`start_server`, and serve until cancelled.
 
 .. code:: python
 
-    loop = asyncio.get_event_loop()
-    server = loop.run_until_complete(_start_server(client_connected))
-    try:
-        loop.run_forever()
-    finally:
-        server.close()
-        loop.run_until_complete(server.wait_closed())
+    async def main():
+        async with await ncplib.start_server(client_connected) as server:
+            await server.serve_forever()
+
+    asyncio.run(main())
 
 
 Advanced usage
@@ -14,6 +14,9 @@ setup(
     install_requires=[
         "async_timeout>=3.0,<5.0",
     ],
+    extras_require={
+        "uvloop": ["uvloop"],
+    },
     classifiers=[
         "Development Status :: 5 - Production/Stable",
         "Environment :: Web Environment",
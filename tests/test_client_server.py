@@ -3,12 +3,18 @@ import asyncio
 from datetime import datetime
 from functools import partial
 import ssl
+import unittest
 from typing import Any, Awaitable, Callable, Mapping, MutableMapping, Optional
 import ncplib
 from ncplib.packets import Param
 from ncplib.server import _create_server_connecton
 from tests.base import AsyncTestCase
 
+try:
+    import uvloop
+except ImportError:  # pragma: no cover
+    uvloop = None  # type: ignore
+
 
 async def echo_server_handler(client: ncplib.Connection) -> None:
     assert client.remote_hostname == "ncplib-test"
@@ -115,6 +121,17 @@ class ClientServerTestCase(AsyncTestCase):
         response = client.send("LINK", "ECHO", FOO="BAR")
         await self.assertMessages(response, "LINK", {"ECHO": {"FOO": "BAR"}})
 
+    async def testSendLogsFields(self) -> None:
+        client = await self.createClient()
+        with self.assertLogs("ncplib.client", "DEBUG") as cm:
+            response = client.send_packet("LINK", ECHO={"FOO": "BAR"}, EHCO={"BAZ": "QUX"})
+        self.assertEqual([record.getMessage() for record in cm.records], [
+            f"Sent packet LINK to {client.remote_hostname} over NCP",
+            f"Sent field LINK ECHO to {client.remote_hostname} over NCP",
+            f"Sent field LINK EHCO to {client.remote_hostname} over NCP",
+        ])
+        await response.recv()
+
     async def testSendFiltersMessages(self) -> None:
         client = await self.createClient()
         client.send("JUNK", "JUNK", JUNK="JUNK")
@@ -150,6 +167,8 @@ class ClientServerTestCase(AsyncTestCase):
         self.assertEqual(cx.warning.field.name, "ECHO")  # type: ignore
         self.assertEqual(cx.warning.detail, "Boom!")  # type: ignore
         self.assertEqual(cx.warning.code, 10)  # type: ignore
+        self.assertEqual(str(cx.warning), "LINK ECHO 'Boom!' (code 10)")
+        self.assertEqual(repr(cx.warning), "CommandWarning(\"LINK ECHO 'Boom!' (code 10)\")")
 
     async def testEncodeError(self) -> None:
         client = await self.createClient()
@@ -256,3 +275,19 @@ class ClientServerTestCase(AsyncTestCase):
         client = await self.createClient(ssl=ssl_ctx)
         response = client.send("LINK", "ECHO", FOO="BAR")
         await self.assertMessages(response, "LINK", {"ECHO": {"FOO": "BAR"}})
+
+
+@unittest.skipIf(uvloop is None, "uvloop is not installed")
+class UvloopClientServerTestCase(ClientServerTestCase):
+
+    def setUp(self) -> None:
+        ncplib.install_uvloop()
+        self.addCleanup(asyncio.set_event_loop_policy, None)
+        super().setUp()
+        self.assertIsInstance(self.loop, uvloop.Loop)
+
+    # Tests.
+
+    async def testClientTransport(self) -> None:
+        client = await self.createClient()
+        self.assertIsInstance(client.transport, uvloop.loop.TCPTransport)  # type: ignore
@@ -4,8 +4,8 @@ from array import array
 from datetime import datetime, timezone
 from math import inf
 from typing import Sequence, Tuple
-from ncplib.packets import Param, encode_packet, decode_packet
-from ncplib import u32, i64, u64, f64
+from ncplib.packets import Param, encode_packet, encode_packet_ns, decode_packet, MAX_FIELD_SIZE, PARAM_HEADER_SIZE
+from ncplib import u32, i64, u64, f64, DecodeWarning
 
 
 REAL_PACKET = (
@@ -132,6 +132,32 @@ class PacketDatasTestCase(unittest.TestCase):
             ]),
         ])
 
+    def testDecodeRealPacketDataEmbeddedFooterBug(self) -> None:
+        with self.assertWarns(DecodeWarning) as cm:
+            fields = decode_packet(REAL_PACKET_EMBEDDED_FOOTER_BUG)[4]
+        self.assertEqual(str(cm.warning), "Encountered 1 embedded packet footer(s)")
+        self.assertEqual(fields, [
+            ("STAT", 1, [
+                ("OCON", 3),
+                ("CADD", "127.0.0.1,127.0.0.1,192.168.1.28"),
+                ("CIDS", "rfeye000709,rfeye000709,python3-ncplib"),
+                ("RGPS", "no GPS,no GPS,no GPS"),
+                ("ELOC", 0),
+            ]),
+            ("SGPS", 1, [
+                ("LATI", 51180800),
+                ("LONG", -100000),
+                ("STAT", 1),
+                ("GFIX", 1),
+                ("SATS", 9),
+                ("SPEE", 20372),
+                ("HEAD", 4256),
+                ("ALTI", 9000),
+                ("UTIM", 1441030068),
+                ("TSTR", "Mon Aug 31 14:07:48 2015"),
+            ]),
+        ])
+
     def testEncodeDecodeValue(self) -> None:
         packet_timestamp = datetime.now(tz=timezone.utc)
         for value, expected_value in PACKET_VALUES:
@@ -148,3 +174,24 @@ class PacketDatasTestCase(unittest.TestCase):
                 self.assertIs(decoded_type, expected_value.__class__)
                 if decoded_type is array:
                     self.assertEqual(value.typecode, decoded_value.typecode)  # type: ignore
+
+    def testEncodePacketNs(self) -> None:
+        packet_timestamp = datetime(2021, 2, 18, 12, 30, 15, 123456, tzinfo=timezone.utc)
+        fields = [("FIEL", 20, [("PARA", "foo")])]
+        encoded_packet = encode_packet_ns("PACK", 10, 1613651415123456000, b"INFO", fields)
+        self.assertEqual(encoded_packet, encode_packet("PACK", 10, packet_timestamp, b"INFO", fields))
+        self.assertEqual(decode_packet(encoded_packet)[2], packet_timestamp)
+
+    def testEncodeParamOverflow(self) -> None:
+        packet_timestamp = datetime.now(tz=timezone.utc)
+        with self.assertRaises(OverflowError):
+            encode_packet("PACK", 10, packet_timestamp, b"INFO", [
+                ("FIEL", 20, [("PARA", bytes(MAX_FIELD_SIZE - PARAM_HEADER_SIZE + 1))]),
+            ])
+
+    def testEncodeFieldOverflow(self) -> None:
+        packet_timestamp = datetime.now(tz=timezone.utc)
+        with self.assertRaises(OverflowError):
+            encode_packet("PACK", 10, packet_timestamp, b"INFO", [
+                ("FIEL", 20, [("PARA", bytes(MAX_FIELD_SIZE - PARAM_HEADER_SIZE))]),
+            ])